@@ -12,6 +12,7 @@ Usage:
   python passport_photo.py --input /path/in.jpg --output /path/out.jpg
   python passport_photo.py --input in.jpg --output out.jpg --size 600 --head-ratio 0.62
   python passport_photo.py --input in.jpg --output out.jpg --no-bg
+  python passport_photo.py --input-dir photos/ --output-dir out/
 
 Notes:
 - This script is for building your own tooling; always verify the final photo meets
@@ -21,38 +22,157 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import atexit
+import os
 import sys
-from dataclasses import dataclass
-from typing import Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, Tuple, Union
 
 import numpy as np
+import PIL
 from PIL import Image, ImageOps
 
 # OpenCV is used for resizing (fast, high-quality interpolation options)
 import cv2
 
-# MediaPipe for face landmarks
-import mediapipe as mp
+# MediaPipe for face landmarks (imported directly rather than via the mp.solutions
+# attribute chain, so the module is loaded once, here)
+from mediapipe.python.solutions import face_mesh as _mp_face_mesh
 
 
-@dataclass(frozen=True)
-class LandmarkPx:
-    x: float
-    y: float
+# FaceMesh indices for nose tip, forehead/top and chin (see _detect_face_landmarks).
+_LANDMARK_IDS = (1, 10, 152)
+
+
+# Pillow-SIMD (a drop-in Pillow fork) tags its versions with ".postN" and ships
+# AVX2 resampling kernels, which make a true Lanczos resize cheap.
+_PILLOW_SIMD = "post" in PIL.__version__
+
+# Landmarks are detected on a copy no larger than this (longest side, px). FaceMesh
+# works on a small ROI internally, so feeding it a full-resolution phone photo
+# only adds cost; coordinates are normalized, so they map back to the original.
+_DETECT_MAX_SIDE = 640
+
+# A single FaceMesh graph is built lazily and reused across calls; building it is
+# far more expensive than running it on one image.
+_FACE_MESH = None
+_FACE_MESH_LOCK = threading.Lock()
+
+
+def _new_face_mesh():
+    """Build a MediaPipe FaceMesh graph configured for single still images."""
+    return _mp_face_mesh.FaceMesh(
+        static_image_mode=True,
+        refine_landmarks=True,
+        max_num_faces=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5,
+    )
+
+
+def _get_face_mesh():
+    """Return the shared (lazily created) MediaPipe FaceMesh instance."""
+    global _FACE_MESH
+    if _FACE_MESH is None:
+        _FACE_MESH = _new_face_mesh()
+        atexit.register(_FACE_MESH.close)
+    return _FACE_MESH
+
+
+# rembg session (ONNX model + InferenceSession), created on first use and reused.
+_REMBG_SESSION = None
+_REMBG_SESSION_LOCK = threading.Lock()
+
+
+def _new_rembg_session(threads: Optional[int] = None):
+    """
+    Create a rembg session, or return None if rembg isn't available.
+
+    threads caps ONNX Runtime's intra-op thread pool (default: all cores), so that
+    several sessions running side by side don't oversubscribe the CPU.
+    """
+    try:
+        from rembg import new_session  # type: ignore
+    except Exception:
+        return None
+    sess_opts = None
+    if threads:
+        import onnxruntime as ort  # type: ignore
+
+        sess_opts = ort.SessionOptions()
+        sess_opts.intra_op_num_threads = threads
+        sess_opts.inter_op_num_threads = 1
+    # Same default model as rembg.remove() uses when no session is given.
+    return new_session(providers=_onnx_providers(), sess_opts=sess_opts)
+
+
+def _get_rembg_session():
+    """Return the shared rembg session, or None if rembg isn't available."""
+    global _REMBG_SESSION
+    if _REMBG_SESSION is None:
+        with _REMBG_SESSION_LOCK:
+            if _REMBG_SESSION is None:
+                _REMBG_SESSION = _new_rembg_session()
+    return _REMBG_SESSION
+
+
+def _onnx_providers() -> list[str]:
+    """ONNX Runtime providers for rembg: CUDA first when available, CPU always."""
+    try:
+        import onnxruntime as ort  # type: ignore
+        available = ort.get_available_providers()
+    except Exception:
+        available = []
+    providers = ["CPUExecutionProvider"]
+    if "CUDAExecutionProvider" in available:
+        providers.insert(0, "CUDAExecutionProvider")
+    return providers
+
+
+# Image.info keys that can carry an orientation; TIFF keeps it in its own tag directory
+_ORIENTATION_INFO_KEYS = ("exif", "xmp", "XML:com.adobe.xmp")
+
+
+def _exif_orientation(img: Image.Image) -> int:
+    """Return the EXIF orientation (1-8), without parsing EXIF for images that have none."""
+    if img.format != "TIFF" and not any(k in img.info for k in _ORIENTATION_INFO_KEYS):
+        return 1
+    return img.getexif().get(0x0112, 1)
 
 
 def _load_image_rgb(path: str) -> Image.Image:
     """Load an image, apply EXIF orientation, return RGB PIL Image."""
     img = Image.open(path)
-    img = ImageOps.exif_transpose(img)
+    # exif_transpose() copies the image even for the identity orientation (1)
+    if _exif_orientation(img) != 1:
+        img = ImageOps.exif_transpose(img)
     if img.mode != "RGB":
         img = img.convert("RGB")
     return img
 
 
+def _load_image_bgr(path: str) -> np.ndarray:
+    """
+    Load an image straight into an OpenCV BGR numpy array (EXIF orientation applied).
+
+    OpenCV decodes into BGR and honours the EXIF orientation tag itself, so this
+    avoids the PIL decode -> numpy copy -> RGB2BGR copy chain. Formats OpenCV
+    can't decode fall back to the PIL loader.
+    """
+    data = np.fromfile(path, dtype=np.uint8)  # also handles non-ASCII paths on Windows
+    img = cv2.imdecode(data, cv2.IMREAD_COLOR) if data.size else None
+    if img is None:
+        return _pil_to_bgr_np(_load_image_rgb(path))
+    return img
+
+
 def _pil_to_bgr_np(img: Image.Image) -> np.ndarray:
     """PIL RGB -> OpenCV BGR numpy array."""
-    arr = np.array(img)  # RGB
+    # cvtColor writes a new array anyway, so read the PIL buffer without np.array()'s
+    # extra copy. (cvtColor's SIMD swap also beats copying an arr[..., ::-1] view.)
+    arr = np.asarray(img)  # RGB
     return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
 
 
@@ -62,57 +182,80 @@ def _bgr_np_to_pil(img_bgr: np.ndarray) -> Image.Image:
     return Image.fromarray(rgb)
 
 
-def _detect_face_landmarks(img_rgb: Image.Image) -> Tuple[LandmarkPx, LandmarkPx, LandmarkPx]:
+def _detect_face_landmarks(
+    img_rgb: Union[Image.Image, np.ndarray],
+    *,
+    bgr: bool = False,
+    face_mesh=None,
+) -> np.ndarray:
     """
-    Detect face mesh landmarks and return (nose_tip, forehead_top, chin) pixel coords.
+    Detect face mesh landmarks and return (nose_tip, forehead_top, chin) pixel coords
+    as a (3, 2) float64 array of (x, y) rows.
+
+    Accepts a PIL RGB image or a uint8 numpy array; pass bgr=True for an OpenCV BGR
+    array (the channel swap then happens on the downscaled detection copy only).
+    Uses the shared FaceMesh unless the caller passes its own `face_mesh`.
 
     Uses MediaPipe FaceMesh landmark indices:
       - nose tip: 1
       - forehead/top: 10  (approx top of forehead)
       - chin: 152
     """
-    mp_face_mesh = mp.solutions.face_mesh
+    # MediaPipe expects a C-contiguous uint8 RGB array; anything else gets copied
+    # again inside its bindings. asarray() avoids an extra copy for PIL inputs.
+    rgb = np.asarray(img_rgb, dtype=np.uint8)
+    h, w = rgb.shape[:2]
 
-    # MediaPipe expects RGB numpy array
-    rgb = np.array(img_rgb)
+    scale = _DETECT_MAX_SIDE / float(max(h, w))
+    if scale < 1.0:
+        rgb = cv2.resize(rgb, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    if bgr:
+        rgb = cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB)
+    rgb = np.ascontiguousarray(rgb)  # no-op for resize/cvtColor output
 
-    with mp_face_mesh.FaceMesh(
-        static_image_mode=True,
-        refine_landmarks=True,
-        max_num_faces=1,
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5,
-    ) as face_mesh:
+    if face_mesh is not None:
         results = face_mesh.process(rgb)
+    else:
+        # The shared graph is not safe to drive from several threads at once
+        # (the GUI processes and validates on worker threads).
+        with _FACE_MESH_LOCK:
+            results = _get_face_mesh().process(rgb)
 
     if not results.multi_face_landmarks:
         raise RuntimeError("No face detected. Try a clearer, front-facing photo with good lighting.")
 
-    h, w = rgb.shape[:2]
+    # Landmarks are normalized to [0, 1], so scaling by the original size gives
+    # original-image pixel coordinates even when detection ran on a thumbnail.
     lm = results.multi_face_landmarks[0].landmark
 
-    def to_px(i: int) -> LandmarkPx:
-        return LandmarkPx(x=lm[i].x * w, y=lm[i].y * h)
-
-    nose_tip = to_px(1)
-    forehead = to_px(10)
-    chin = to_px(152)
+    pts = np.array([[lm[i].x * w, lm[i].y * h] for i in _LANDMARK_IDS], dtype=np.float64)
 
     # Basic sanity: chin below forehead
-    if chin.y <= forehead.y:
+    if pts[2, 1] <= pts[1, 1]:
         raise RuntimeError("Face landmarks looked inconsistent. Try a different image.")
 
-    return nose_tip, forehead, chin
+    return pts
 
 
 def _resize_bgr(img_bgr: np.ndarray, scale: float) -> np.ndarray:
-    """Resize OpenCV BGR image by scale."""
+    """
+    Resize OpenCV BGR image by scale.
+
+    Uses INTER_AREA when shrinking (anti-aliased, and the typical passport case) and
+    INTER_CUBIC when enlarging. Both have SIMD paths in OpenCV; INTER_LANCZOS4 runs
+    a scalar fallback for 8-bit images and is several times slower. With Pillow-SIMD
+    installed, Pillow's vectorized Lanczos is used instead.
+    """
     if scale <= 0:
         raise ValueError("Scale must be > 0")
     h, w = img_bgr.shape[:2]
     new_w = max(1, int(round(w * scale)))
     new_h = max(1, int(round(h * scale)))
-    return cv2.resize(img_bgr, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+    if _PILLOW_SIMD:
+        # Resampling is per-channel, so the BGR buffer can go through PIL as "RGB".
+        return np.asarray(Image.fromarray(img_bgr).resize((new_w, new_h), Image.LANCZOS))
+    interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+    return cv2.resize(img_bgr, (new_w, new_h), interpolation=interp)
 
 
 def _crop_square_with_padding(
@@ -124,6 +267,9 @@ def _crop_square_with_padding(
     """
     Crop a size x size square centered at center_xy from img_bgr.
     If crop goes out of bounds, pad with pad_color_bgr.
+
+    When the square lies fully inside the image, a view into img_bgr is returned
+    (no copy); copy it before writing to it.
     """
     h, w = img_bgr.shape[:2]
     cx, cy = center_xy
@@ -134,9 +280,6 @@ def _crop_square_with_padding(
     right = left + size
     bottom = top + size
 
-    # Destination canvas
-    out = np.full((size, size, 3), pad_color_bgr, dtype=np.uint8)
-
     # Source region intersection
     src_left = max(0, left)
     src_top = max(0, top)
@@ -145,40 +288,135 @@ def _crop_square_with_padding(
 
     if src_left >= src_right or src_top >= src_bottom:
         # Entire crop out of bounds
-        return out
+        return np.full((size, size, 3), pad_color_bgr, dtype=np.uint8)
 
-    # Destination placement
-    dst_left = src_left - left
-    dst_top = src_top - top
-    dst_right = dst_left + (src_right - src_left)
-    dst_bottom = dst_top + (src_bottom - src_top)
+    core = img_bgr[src_top:src_bottom, src_left:src_right]
 
-    out[dst_top:dst_bottom, dst_left:dst_right] = img_bgr[src_top:src_bottom, src_left:src_right]
-    return out
+    # Padding needed on each side (all zero in the common, fully-inside case)
+    pad_left = src_left - left
+    pad_top = src_top - top
+    pad_right = right - src_right
+    pad_bottom = bottom - src_bottom
+    if not (pad_left or pad_top or pad_right or pad_bottom):
+        return core
+
+    return cv2.copyMakeBorder(
+        core, pad_top, pad_bottom, pad_left, pad_right, cv2.BORDER_CONSTANT, value=pad_color_bgr
+    )
+
+
+def _crop_and_resize_bgr(
+    img_bgr: np.ndarray,
+    center_xy: Tuple[float, float],
+    scale: float,
+    size: int,
+    pad_color_bgr: Tuple[int, int, int] = (255, 255, 255),
+) -> np.ndarray:
+    """
+    Equivalent to resizing img_bgr by scale and then cropping a size x size square
+    centered at center_xy * scale, but only the source region that ends up in the
+    output is resampled.
+
+    The crop is taken at source resolution (size / scale pixels per side) and then
+    resized, rather than sampled with a single warpAffine: warpAffine has no
+    area-averaging mode, so large downscales would alias.
+    """
+    src_size = max(1, int(round(size / scale)))
+    roi = _crop_square_with_padding(img_bgr, center_xy, size=src_size, pad_color_bgr=pad_color_bgr)
+    return _resize_bgr(roi, size / float(src_size))
 
 
-def _white_background_with_rembg(pil_rgb: Image.Image) -> Image.Image:
+def _white_background_with_rembg(img_bgr: np.ndarray, session=None) -> np.ndarray:
     """
     Remove background using rembg and composite onto a white background.
+    Works on (and returns) an OpenCV BGR array. Uses the shared rembg session
+    unless one is passed in.
     If rembg isn't available or fails, returns original image.
     """
     try:
-        from rembg import remove  # type: ignore
+        if session is None:
+            session = _get_rembg_session()
+        if session is None:
+            return img_bgr
+
+        # Only the foreground mask is needed; rembg's remove() would also build an
+        # RGBA cutout that then has to be alpha-composited in PIL.
+        mask = session.predict(Image.fromarray(img_bgr[..., ::-1]))[0]
+        alpha = np.asarray(mask.convert("L"))
+        h, w = img_bgr.shape[:2]
+        if alpha.shape != (h, w):
+            alpha = cv2.resize(alpha, (w, h), interpolation=cv2.INTER_LINEAR)
+
+        # out = (fg * a + 255 * (255 - a)) / 255, rounded, in 16-bit integer math
+        # (max 255 * 255 + 127 fits in uint16); half the bytes of a float32 blend.
+        a = alpha[..., None].astype(np.uint16)
+        out = img_bgr.astype(np.uint16) * a
+        out += 255 * (255 - a)
+        out += 127
+        out //= 255
+        return out.astype(np.uint8)
     except Exception:
-        return pil_rgb
+        return img_bgr
 
+
+def _save_bgr(path: str, img_bgr: np.ndarray) -> None:
+    """
+    Encode an OpenCV BGR image with OpenCV (libjpeg-turbo) and write it to path.
+
+    JPEG uses quality 95, baseline. Extensions OpenCV can't encode go through PIL.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    params: list[int] = []
+    if ext in (".jpg", ".jpeg"):
+        params = [int(cv2.IMWRITE_JPEG_QUALITY), 95, int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0]
     try:
-        # rembg works well with PIL; it returns an RGBA image (usually)
-        cut = remove(pil_rgb)
-        if isinstance(cut, bytes):
-            cut = Image.open(io.BytesIO(cut))  # pragma: no cover
-        cut = cut.convert("RGBA")
-
-        white = Image.new("RGBA", cut.size, (255, 255, 255, 255))
-        comp = Image.alpha_composite(white, cut).convert("RGB")
-        return comp
-    except Exception:
-        return pil_rgb
+        ok, buf = cv2.imencode(ext, img_bgr, params)
+    except cv2.error:
+        ok = False
+    if not ok:
+        _bgr_np_to_pil(img_bgr).save(path)
+        return
+    buf.tofile(path)  # also handles non-ASCII paths on Windows
+
+
+def _render_passport_bgr(
+    input_path: str,
+    size: int,
+    head_ratio: float,
+    remove_background: bool,
+    pipeline: Optional["PassportPipeline"],
+) -> np.ndarray:
+    """Run the full pipeline on input_path and return the size x size BGR result."""
+    if size < 200:
+        raise ValueError("size too small; expected something like 600")
+    if not (0.50 <= head_ratio <= 0.69):
+        # This range is commonly cited for digital framing guidance.
+        raise ValueError("head_ratio should be between 0.50 and 0.69 for typical U.S. passport framing guidance.")
+    if remove_background and pipeline is not None and not pipeline.remove_background:
+        # Falling back to the shared rembg session would break one-pipeline-per-thread.
+        raise ValueError("pipeline was built with remove_background=False")
+
+    # Decode once into BGR; PIL is only needed again for the final image
+    bgr = _load_image_bgr(input_path)
+
+    # Detect landmarks on the original image
+    face_mesh = pipeline.face_mesh if pipeline is not None else None
+    pts = _detect_face_landmarks(bgr, bgr=True, face_mesh=face_mesh)  # rows: nose tip, forehead, chin
+    head_height_px = pts[2, 1] - pts[1, 1]
+
+    # Compute scale so head height matches the desired proportion of the output
+    target_head_px = head_ratio * float(size)
+    scale = target_head_px / float(head_height_px)
+
+    # Crop square around the face center (nose tip is a stable anchor), then scale
+    # only the crop rather than the whole image
+    cropped = _crop_and_resize_bgr(bgr, tuple(pts[0]), scale=scale, size=size, pad_color_bgr=(255, 255, 255))
+
+    out_bgr = cropped
+    if remove_background:
+        session = pipeline.rembg_session if pipeline is not None else None
+        out_bgr = _white_background_with_rembg(cropped, session=session)
+    return out_bgr
 
 
 def process_passport_photo(
@@ -187,6 +425,7 @@ def process_passport_photo(
     size: int = 600,
     head_ratio: float = 0.62,
     remove_background: bool = True,
+    pipeline: Optional["PassportPipeline"] = None,
 ) -> None:
     """
     Process input image and save a square output at `size` x `size`.
@@ -197,49 +436,179 @@ def process_passport_photo(
       size: output side length in pixels (default 600)
       head_ratio: target head height as a fraction of output height (e.g., 0.62)
       remove_background: if True, attempts background removal -> white background
+      pipeline: optional PassportPipeline whose models to use instead of the
+        shared module-level ones
     """
-    if size < 200:
-        raise ValueError("size too small; expected something like 600")
-    if not (0.50 <= head_ratio <= 0.69):
-        # This range is commonly cited for digital framing guidance.
-        raise ValueError("head_ratio should be between 0.50 and 0.69 for typical U.S. passport framing guidance.")
+    out_bgr = _render_passport_bgr(input_path, size, head_ratio, remove_background, pipeline)
+    _save_bgr(output_path, out_bgr)
 
-    pil = _load_image_rgb(input_path)
 
-    # Detect landmarks on the original image
-    nose, forehead, chin = _detect_face_landmarks(pil)
-    head_height_px = chin.y - forehead.y
+def process_passport_photo_to_pil(
+    input_path: str,
+    size: int = 600,
+    head_ratio: float = 0.62,
+    remove_background: bool = True,
+    pipeline: Optional["PassportPipeline"] = None,
+) -> Image.Image:
+    """
+    Same as process_passport_photo(), but return the result as an RGB PIL image
+    instead of writing it to disk (e.g. for an in-process preview).
+    """
+    out_bgr = _render_passport_bgr(input_path, size, head_ratio, remove_background, pipeline)
+    return _bgr_np_to_pil(out_bgr)
 
-    # Compute scale so head height matches the desired proportion of the output
-    target_head_px = head_ratio * float(size)
-    scale = target_head_px / float(head_height_px)
 
-    # Resize the whole image and scale landmark coordinates too
-    bgr = _pil_to_bgr_np(pil)
-    bgr_rs = _resize_bgr(bgr, scale)
+class PassportPipeline:
+    """
+    Models for processing many photos in one process.
 
-    nose_rs = (nose.x * scale, nose.y * scale)
+    The FaceMesh graph and (optionally) the rembg session are built once, up front,
+    so per-image cost is inference only. An instance is not thread-safe; use one per
+    thread (batch mode keeps one per worker).
+    """
 
-    # Crop square around the face center (nose tip is a stable anchor)
-    cropped = _crop_square_with_padding(bgr_rs, nose_rs, size=size, pad_color_bgr=(255, 255, 255))
+    def __init__(self, remove_background: bool = True, threads: Optional[int] = None):
+        self.remove_background = remove_background
+        self.face_mesh = _new_face_mesh()
+        self.rembg_session = _new_rembg_session(threads) if remove_background else None
+
+    def process(
+        self,
+        input_path: str,
+        output_path: str,
+        size: int = 600,
+        head_ratio: float = 0.62,
+        remove_background: Optional[bool] = None,
+    ) -> None:
+        """
+        Same as process_passport_photo(), using this pipeline's models.
+
+        remove_background defaults to the value the pipeline was built with.
+        """
+        if remove_background is None:
+            remove_background = self.remove_background
+        process_passport_photo(
+            input_path=input_path,
+            output_path=output_path,
+            size=size,
+            head_ratio=head_ratio,
+            remove_background=remove_background,
+            pipeline=self,
+        )
 
-    out_pil = _bgr_np_to_pil(cropped)
+    def close(self) -> None:
+        self.face_mesh.close()
 
-    if remove_background:
-        out_pil = _white_background_with_rembg(out_pil)
 
-    # Save with good JPEG quality by default
-    out_lower = output_path.lower()
-    if out_lower.endswith((".jpg", ".jpeg")):
-        out_pil.save(output_path, format="JPEG", quality=95, optimize=True)
-    else:
-        out_pil.save(output_path)
+# Input extensions picked up by --input-dir
+_BATCH_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".webp", ".tif", ".tiff")
+
+
+def _batch_jobs(input_dir: str, output_dir: str) -> list[tuple[Path, Path]]:
+    """
+    (input, output) pairs for every image under input_dir, mirroring subfolders.
+
+    Earlier results are never picked up as inputs, even when output_dir is input_dir
+    itself or a folder inside it.
+    """
+    in_root = Path(input_dir)
+    out_root = Path(output_dir)
+    out_real = out_root.resolve()
+    nested_out = out_real != in_root.resolve()
+    jobs = []
+    for src in sorted(in_root.rglob("*")):
+        if not (src.is_file() and src.suffix.lower() in _BATCH_EXTS):
+            continue
+        if nested_out and out_real in src.resolve().parents:
+            continue
+        rel = src.relative_to(in_root)
+        jobs.append((src, out_root / rel.parent / f"{src.stem}_passport{src.suffix}"))
+    # Writing next to the inputs: skip files that are another job's output.
+    outputs = {dst.resolve() for _, dst in jobs}
+    return [(src, dst) for src, dst in jobs if src.resolve() not in outputs]
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    jobs = _batch_jobs(args.input_dir, args.output_dir)
+    if not jobs:
+        print(f"ERROR: no images found in {args.input_dir}", file=sys.stderr)
+        return 2
+
+    try:
+        from tqdm import tqdm  # type: ignore
+    except Exception:
+        tqdm = None
+
+    remove_background = not args.no_bg
+
+    # Decode/encode, FaceMesh and ONNX Runtime all release the GIL, so a few worker
+    # threads overlap I/O with inference. Models aren't shared between threads:
+    # each worker lazily builds its own PassportPipeline.
+    local = threading.local()
+    pipelines: list[PassportPipeline] = []
+    pipelines_lock = threading.Lock()
+
+    # Split the cores between workers so ONNX Runtime's per-session thread pools
+    # don't oversubscribe the CPU (they default to one thread per core each).
+    workers = max(1, args.workers)
+    threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+
+    def thread_pipeline() -> PassportPipeline:
+        pipeline = getattr(local, "pipeline", None)
+        if pipeline is None:
+            pipeline = PassportPipeline(remove_background=remove_background, threads=threads_per_worker)
+            local.pipeline = pipeline
+            with pipelines_lock:
+                pipelines.append(pipeline)
+        return pipeline
+
+    def run_one(src: Path, dst: Path) -> None:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        thread_pipeline().process(
+            str(src),
+            str(dst),
+            size=args.size,
+            head_ratio=args.head_ratio,
+            remove_background=remove_background,
+        )
+
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_one, src, dst): src for src, dst in jobs}
+            done = as_completed(futures)
+            if tqdm is not None:
+                done = tqdm(done, total=len(futures), unit="img")
+            for fut in done:
+                try:
+                    fut.result()
+                except Exception as e:
+                    failed += 1
+                    msg = f"ERROR: {futures[fut]}: {e}"
+                    if tqdm is not None:
+                        tqdm.write(msg, file=sys.stderr)
+                    else:
+                        print(msg, file=sys.stderr)
+    finally:
+        for pipeline in pipelines:
+            pipeline.close()
+
+    print(f"Saved {len(jobs) - failed}/{len(jobs)} images to {args.output_dir}")
+    return 2 if failed else 0
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Generate a 600x600 U.S. passport-style photo from an input image.")
-    p.add_argument("--input", "-i", required=True, help="Path to input image (jpg/png/heic converted, etc.)")
-    p.add_argument("--output", "-o", required=True, help="Path to output image (jpg/png)")
+    p.add_argument("--input", "-i", help="Path to input image (jpg/png/heic converted, etc.)")
+    p.add_argument("--output", "-o", help="Path to output image (jpg/png)")
+    p.add_argument("--input-dir", help="Batch mode: process every image under this folder")
+    p.add_argument("--output-dir", help="Batch mode: write <name>_passport.<ext> files here")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Batch mode: number of images processed in parallel (default: half the CPUs)",
+    )
     p.add_argument("--size", type=int, default=600, help="Output size in pixels (default: 600)")
     p.add_argument("--head-ratio", type=float, default=0.62, help="Target head height / image height (0.50–0.69)")
     p.add_argument("--no-bg", action="store_true", help="Disable background removal/whitening step")
@@ -247,7 +616,17 @@ def _build_arg_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: Optional[list[str]] = None) -> int:
-    args = _build_arg_parser().parse_args(argv)
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+
+    if args.input_dir or args.output_dir:
+        if not (args.input_dir and args.output_dir):
+            parser.error("--input-dir and --output-dir must be given together")
+        if args.input or args.output:
+            parser.error("use either --input/--output or --input-dir/--output-dir")
+        return _run_batch(args)
+    if not (args.input and args.output):
+        parser.error("--input and --output are required (or --input-dir and --output-dir)")
 
     try:
         process_passport_photo(
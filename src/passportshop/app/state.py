@@ -20,7 +20,7 @@ class AppState:
     """
     # Input
     input_path: Optional[str] = None
-    original_pil: Optional["Image.Image"] = None
+    original_pil: Optional["Image.Image"] = None  # display copy; may be decoded at reduced size
 
     # Output (preview)
     processed_pil: Optional["Image.Image"] = None
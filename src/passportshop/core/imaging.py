@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+# Register only the decoders the upload dialog offers, so Image.open() never has to
+# import and probe Pillow's full plugin list.
+from PIL import BmpImagePlugin, JpegImagePlugin, PngImagePlugin, TiffImagePlugin, WebPImagePlugin  # noqa: F401
+
+# Image.info keys that can carry an orientation; TIFF keeps it in its own tag directory
+_ORIENTATION_INFO_KEYS = ("exif", "xmp", "XML:com.adobe.xmp")
+
+# File extension -> the single Pillow format to try first when opening it
+_EXT_TO_FORMATS = {
+    ".jpg": ["JPEG"],
+    ".jpeg": ["JPEG"],
+    ".png": ["PNG"],
+    ".bmp": ["BMP"],
+    ".webp": ["WEBP"],
+    ".tif": ["TIFF"],
+    ".tiff": ["TIFF"],
+}
+
+
+def exif_orientation(img: Image.Image) -> int:
+    """Return the EXIF orientation (1-8), without parsing EXIF for images that have none."""
+    if img.format != "TIFF" and not any(k in img.info for k in _ORIENTATION_INFO_KEYS):
+        return 1
+    return img.getexif().get(0x0112, 1)
+
+
+def load_image_rgb(path: str, max_side: int | None = None) -> tuple[Image.Image, tuple[int, int]]:
+    """
+    Load an upright, fully decoded RGB image and return it with its full-resolution (w, h).
+
+    With max_side, JPEGs are decoded at a reduced DCT scale (1/2, 1/4, 1/8) that
+    still covers max_side, which is far cheaper than a full decode; the returned
+    image is then only suitable for display.
+    """
+    formats = _EXT_TO_FORMATS.get(os.path.splitext(path)[1].lower())
+    try:
+        img = Image.open(path, formats=formats)
+    except UnidentifiedImageError:
+        if formats is None:
+            raise
+        img = Image.open(path)  # extension doesn't match the content; probe
+
+    full_w, full_h = img.size
+    if max_side and img.format == "JPEG" and max(full_w, full_h) > max_side:
+        f = max_side / float(max(full_w, full_h))
+        img.draft("RGB", (max(1, int(full_w * f)), max(1, int(full_h * f))))
+    decoded_size = img.size
+
+    # Decode now, on the caller's thread, and release the file. Upright RGB images
+    # skip both steps below, so otherwise the first draw would decode them.
+    img.load()
+
+    # exif_transpose() copies the whole image even when no rotation is needed
+    if exif_orientation(img) != 1:
+        img = ImageOps.exif_transpose(img)
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    if img.size != decoded_size:  # rotated by 90/270 degrees
+        full_w, full_h = full_h, full_w
+    return img, (full_w, full_h)
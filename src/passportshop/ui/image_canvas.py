@@ -10,6 +10,10 @@ from PIL import Image, ImageTk
 class ImageCanvas(ttk.Frame):
     """A resizable canvas that can display a PIL image scaled to fit."""
 
+    # While the window is being resized, redraw with a cheap filter and only do the
+    # high-quality resize once <Configure> events have stopped for this long.
+    RESIZE_SETTLE_MS = 50
+
     def __init__(self, master, *, bg: str = "#f3f3f3"):
         super().__init__(master)
         self._canvas = tk.Canvas(self, highlightthickness=0, bg=bg)
@@ -17,6 +21,11 @@ class ImageCanvas(ttk.Frame):
 
         self._photo: Optional[ImageTk.PhotoImage] = None
         self._pil: Optional[Image.Image] = None
+        # (width, height, id(pil)) that self._photo was rendered for, and the
+        # reducing_gap (quality) it was rendered with
+        self._photo_key: Optional[Tuple[int, int, int]] = None
+        self._photo_gap = 0.0
+        self._resize_job: Optional[str] = None
 
         self._canvas.bind("<Configure>", self._on_resize)
 
@@ -29,13 +38,32 @@ class ImageCanvas(ttk.Frame):
 
     def set_image(self, pil: Optional[Image.Image]) -> None:
         self._pil = pil
-        self._redraw()
+        self._photo_key = None
+        self._cancel_resize_job()
+        self._redraw_hq()
 
     def clear(self) -> None:
         self.set_image(None)
 
     def _on_resize(self, _evt) -> None:
-        self._redraw()
+        self._redraw_fast()
+        self._cancel_resize_job()
+        self._resize_job = self.after(self.RESIZE_SETTLE_MS, self._redraw_hq)
+
+    def _cancel_resize_job(self) -> None:
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+            self._resize_job = None
+
+    # Previews are downscaled with a cheap box reduce() followed by bilinear;
+    # reducing_gap=2.0 keeps the final bilinear step within 2x, which looks the same
+    # as Lanczos on screen at a fraction of the cost. Lanczos is for saved output.
+    def _redraw_fast(self) -> None:
+        self._redraw(reducing_gap=1.0)
+
+    def _redraw_hq(self) -> None:
+        self._resize_job = None
+        self._redraw(reducing_gap=2.0)
 
     def _fit_size(self, img_w: int, img_h: int, box_w: int, box_h: int) -> Tuple[int, int]:
         if img_w <= 0 or img_h <= 0 or box_w <= 2 or box_h <= 2:
@@ -45,7 +73,7 @@ class ImageCanvas(ttk.Frame):
         new_h = max(1, int(img_h * scale))
         return new_w, new_h
 
-    def _redraw(self) -> None:
+    def _redraw(self, reducing_gap: float = 2.0) -> None:
         self._canvas.delete("img")
         if self._pil is None:
             self._canvas.itemconfigure(self._placeholder_id, state="normal")
@@ -58,9 +86,17 @@ class ImageCanvas(ttk.Frame):
 
         pil = self._pil
         new_w, new_h = self._fit_size(pil.width, pil.height, w, h)
-        resized = pil.resize((new_w, new_h), Image.LANCZOS)
 
-        self._photo = ImageTk.PhotoImage(resized)
+        # Same image at the same size: reuse the PhotoImage instead of resampling
+        # and uploading the pixels to Tk again, unless it was drawn at lower quality
+        # than requested (a fast redraw is then upgraded by the settle pass).
+        key = (new_w, new_h, id(pil))
+        if self._photo is None or key != self._photo_key or self._photo_gap < reducing_gap:
+            resized = pil.resize((new_w, new_h), Image.BILINEAR, reducing_gap=reducing_gap)
+            self._photo = ImageTk.PhotoImage(resized)
+            self._photo_key = key
+            self._photo_gap = reducing_gap
+
         x = (w - new_w) // 2
         y = (h - new_h) // 2
         self._canvas.create_image(x, y, anchor="nw", image=self._photo, tags=("img",))
@@ -2,26 +2,120 @@ from __future__ import annotations
 
 import os
 import json
+import queue
 import shutil
-from pathlib import Path
 import threading
+from concurrent.futures import Future
+from pathlib import Path
 import traceback
 import tkinter as tk
 from dataclasses import asdict, replace
 from tkinter import filedialog, messagebox, ttk
+from typing import Callable, TypeVar
 
-from PIL import Image, ImageOps
+from PIL import Image
 
 from passportshop.app.state import AppState
 from passportshop.app.temp_paths import TempPaths
+from passportshop.core.imaging import load_image_rgb
+from passportshop.core.models import ProcessingParams
 from passportshop.ui.image_canvas import ImageCanvas
-from passportshop.validation.validator import format_report_text, validate_passport_photo
+from passportshop.validation.report import ValidationReport
+from passportshop.validation.validator import (
+    PixelMetrics,
+    format_report_rows,
+    format_report_text,
+    validate_passport_photo_with_metrics,
+)
+
+
+def _import_pipeline():
+    """
+    Import the existing non-GUI pipeline (expected to be in your project root as
+    passport_photo.py). Returns process_passport_photo_to_pil, or None if unavailable.
+
+    This pulls in cv2/mediapipe/onnxruntime, so it runs on a background thread at
+    startup instead of delaying the first paint of the window.
+    """
+    try:
+        from passport_photo import process_passport_photo_to_pil  # type: ignore
+    except Exception:
+        return None
+    return process_passport_photo_to_pil
+
+
+T = TypeVar("T")
+
+
+class _Worker:
+    """
+    Runs submitted jobs one at a time, in submission order, on one daemon thread.
+
+    Like a single-thread ThreadPoolExecutor, except that the thread is a daemon:
+    a job still running when the window closes (e.g. a multi-second rembg Process)
+    doesn't keep the process alive.
+    """
+
+    def __init__(self, name: str):
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+
+    def submit(self, fn: Callable[..., T], *args) -> Future:
+        fut: Future = Future()
+        self._jobs.put((fut, fn, args))
+        return fut
+
+    def shutdown(self) -> None:
+        """Drop the jobs still queued; a job already running is abandoned."""
+        self._closed = True
+        self._jobs.put(None)
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None or self._closed:
+                return
+            _run_job(*job)
+
+
+def _run_job(fut: Future, fn: Callable[..., T], args: tuple) -> None:
+    if not fut.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args)
+    except BaseException as e:
+        fut.set_exception(e)
+    else:
+        fut.set_result(result)
+
 
-# Use the existing non-GUI pipeline (expected to be in your project root as passport_photo.py)
-try:
-    from passport_photo import process_passport_photo  # type: ignore
-except Exception:
-    process_passport_photo = None
+def _run_in_thread(fn: Callable[[], T], name: str) -> Future:
+    """Run fn on its own daemon thread, next to the worker; returns its Future."""
+    fut: Future = Future()
+    threading.Thread(target=_run_job, args=(fut, fn, ()), name=name, daemon=True).start()
+    return fut
+
+
+def _validate_and_format(
+    processed: Image.Image, params: ProcessingParams, pixel_metrics: PixelMetrics | None
+) -> tuple[ValidationReport, list[tuple[str, str, str]], str, PixelMetrics | None]:
+    """
+    Validate on the worker and pre-format the report for the tree and the clipboard.
+
+    pixel_metrics are the cached statistics of this same image, or None to compute
+    them; the ones used are returned so the app can reuse them on the next Validate.
+    """
+    report, pixel_metrics = validate_passport_photo_with_metrics(processed, params, pixel_metrics=pixel_metrics)
+    return report, format_report_rows(report), format_report_text(report), pixel_metrics
+
+
+# Indeterminate progress animation step; each step is a Tk timer wakeup and a redraw
+_PROGRESS_INTERVAL_MS = 50
+
+
+# Uploaded originals are only previewed, so JPEGs are decoded at reduced size
+_ORIGINAL_PREVIEW_MAX_SIDE = 1600
 
 
 class PassportShopApp(ttk.Frame):
@@ -35,6 +129,23 @@ class PassportShopApp(ttk.Frame):
         # Stable temp paths for preview output
         self.temp_paths = TempPaths.default(app_name="passportshop")
 
+        # One long-lived worker: load/process/validate run one at a time, in click order.
+        self._worker = _Worker(name="ppshop-worker")
+        self._closing = False
+        # Warm the pipeline import on a thread of its own: Upload doesn't need it, and
+        # only Process waits for it (Validate always follows a Process).
+        self._pipeline_future = _run_in_thread(_import_pipeline, name="ppshop-import")
+
+        # Formatted once per report (on the worker) for the tree and the clipboard
+        self._report_rows: list[tuple[str, str, str]] = []
+        self._report_text: str | None = None
+        # Pixel statistics of the last validated image; valid only for that exact object
+        self._pixel_metrics: tuple[Image.Image, PixelMetrics] | None = None
+
+        # Latest image requested per canvas, applied together on the next idle
+        self._pending_canvas_images: dict[ImageCanvas, Image.Image | None] = {}
+        self._canvas_flush_job: str | None = None
+
         self._build_style()
         self._build_layout()
         self._bind_shortcuts()
@@ -134,10 +245,29 @@ class PassportShopApp(ttk.Frame):
         self.btn_defaults = ttk.Button(settings, text="Restore defaults", command=self.on_restore_defaults)
         self.btn_defaults.grid(row=3, column=0, sticky="w", pady=(8, 0))
 
-        # Validation tab
-        tab_val = ttk.Frame(nb, padding=8)
-        nb.add(tab_val, text="Validation")
+        # Validation tab: its widgets are built the first time the tab is shown
+        self._notebook = nb
+        self._tab_val = ttk.Frame(nb, padding=8)
+        nb.add(self._tab_val, text="Validation")
+        self.tree: ttk.Treeview | None = None
+        self.btn_copy_report: ttk.Button | None = None
+        self._copy_report_enabled = False
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Status bar
+        status = ttk.Frame(self, padding=(10, 6))
+        status.pack(side="bottom", fill="x")
+
+        self.status_var = tk.StringVar(value="Ready.")
+        self.status_label = ttk.Label(status, textvariable=self.status_var)
+        self.status_label.pack(side="left")
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        if self.tree is None and self._notebook.select() == str(self._tab_val):
+            self._build_validation_tab()
 
+    def _build_validation_tab(self) -> None:
+        tab_val = self._tab_val
         tab_val.columnconfigure(0, weight=1)
         tab_val.rowconfigure(0, weight=1)
 
@@ -159,13 +289,9 @@ class PassportShopApp(ttk.Frame):
         self.btn_copy_report = ttk.Button(btn_row, text="Copy report", command=self.on_copy_report)
         self.btn_copy_report.pack(side="left")
 
-        # Status bar
-        status = ttk.Frame(self, padding=(10, 6))
-        status.pack(side="bottom", fill="x")
-
-        self.status_var = tk.StringVar(value="Ready.")
-        self.status_label = ttk.Label(status, textvariable=self.status_var)
-        self.status_label.pack(side="left")
+        # Catch up with a report that arrived before the tab was first shown
+        self._populate_report(self._report_rows)
+        self._set_copy_report_enabled(self._copy_report_enabled)
 
     def _bind_shortcuts(self) -> None:
         self.master.bind_all("<Control-o>", lambda e: self.on_upload())
@@ -182,19 +308,70 @@ class PassportShopApp(ttk.Frame):
     def set_status(self, text: str) -> None:
         self.status_var.set(text)
 
+    def shutdown(self) -> None:
+        # Drop queued jobs; a job already running is abandoned (its thread is a daemon).
+        self._closing = True
+        self._worker.shutdown()
+
+    def _post(self, fn: Callable[..., object], *args) -> None:
+        """From a worker: run fn(*args) on the Tk thread, unless the window is closing."""
+        if self._closing:
+            return
+        try:
+            self.master.after(0, fn, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # root destroyed between the check and the call
+
     def set_busy(self, busy: bool, message: str | None = None) -> None:
         if message:
             self.set_status(message)
         if busy:
-            self.progress.start(12)
+            self.progress.start(_PROGRESS_INTERVAL_MS)
         else:
             self.progress.stop()
 
+    def _with_busy(self, message: str, fn: Callable[[], T]) -> T:
+        """
+        Run a short blocking fn on the UI thread with the controls disabled.
+
+        The busy state is flushed with a single update_idletasks() so the status
+        message shows before fn blocks; a full update() would also dispatch queued
+        events (e.g. a second click) in the middle of this handler.
+        """
+        self._set_processing_ui(True, message=message)
+        self.master.update_idletasks()
+        try:
+            return fn()
+        finally:
+            self._set_processing_ui(False)
+
+    def _schedule_canvas_image(self, canvas: ImageCanvas, pil: Image.Image | None) -> None:
+        """
+        Show pil (or clear, for None) on canvas at the next idle point.
+
+        Updates requested in quick succession (e.g. Reset, or rapid uploads) are
+        coalesced: only the latest image per canvas is drawn, in a single pass.
+        """
+        self._pending_canvas_images[canvas] = pil
+        if self._canvas_flush_job is None:
+            self._canvas_flush_job = self.master.after_idle(self._flush_canvas_images)
+
+    def _flush_canvas_images(self) -> None:
+        self._canvas_flush_job = None
+        pending, self._pending_canvas_images = self._pending_canvas_images, {}
+        for canvas, pil in pending.items():
+            canvas.set_image(pil)
+
     def _set_buttons_initial_state(self) -> None:
         self.btn_process.state(["disabled"])
         self.btn_validate.state(["disabled"])
         self.btn_save.state(["disabled"])
-        self.btn_copy_report.state(["disabled"])
+        self._set_copy_report_enabled(False)
+
+    def _set_copy_report_enabled(self, enabled: bool) -> None:
+        self._copy_report_enabled = enabled
+        if self.btn_copy_report is not None:
+            self.btn_copy_report.state(["!disabled" if enabled else "disabled"])
 
     def _set_processing_ui(self, processing: bool, message: str = "Working…") -> None:
         if processing:
@@ -203,7 +380,7 @@ class PassportShopApp(ttk.Frame):
             self.btn_validate.state(["disabled"])
             self.btn_save.state(["disabled"])
             self.btn_reset.state(["disabled"])
-            self.btn_copy_report.state(["disabled"])
+            self._set_copy_report_enabled(False)
             self.set_busy(True, message)
         else:
             self.btn_upload.state(["!disabled"])
@@ -221,47 +398,47 @@ class PassportShopApp(ttk.Frame):
                 self.btn_validate.state(["disabled"])
                 self.btn_save.state(["disabled"])
 
-            if self.state.validation_report is not None:
-                self.btn_copy_report.state(["!disabled"])
-            else:
-                self.btn_copy_report.state(["disabled"])
+            self._set_copy_report_enabled(self.state.validation_report is not None)
 
             self.set_busy(False)
 
     def _clear_validation_view(self) -> None:
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
-        self.btn_copy_report.state(["disabled"])
-
-    def _render_validation_report(self) -> None:
+        if self.tree is not None:
+            children = self.tree.get_children()
+            if children:
+                self.tree.delete(*children)  # one Tcl call for all rows
+        self._set_copy_report_enabled(False)
+        self._report_rows = []
+        self._report_text = None
+
+    def _render_validation_report(self, rows: list[tuple[str, str, str]], text: str) -> None:
         self._clear_validation_view()
-        report = self.state.validation_report
-        if report is None:
-            return
-
-        for r in report.results:
-            status = "✅" if r.passed else "❌"
-            self.tree.insert("", "end", values=(r.rule_id, status, r.message))
-
-        self.btn_copy_report.state(["!disabled"])
-
-    def _load_image_rgb(self, path: str) -> Image.Image:
-        img = Image.open(path)
-        img = ImageOps.exif_transpose(img)
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-        return img
+        self._report_rows = rows
+        self._report_text = text
+        if self.tree is not None:
+            self._populate_report(rows)
+        self._set_copy_report_enabled(True)
+
+    def _populate_report(self, rows: list[tuple[str, str, str]]) -> None:
+        # Unmap the tree while filling it so Tk lays it out once, not once per row;
+        # grid() restores the previous grid options.
+        self.tree.grid_remove()
+        for values in rows:
+            self.tree.insert("", "end", values=values)
+        self.tree.grid()
 
     def _sync_params_from_ui(self) -> None:
         # ProcessingParams is frozen -> replace() to update
+        # Invalid entries keep the previous value. Tk raises TclError for text that isn't
+        # a number; OverflowError comes from IntVar.get() on values like "1e400".
         params = self.state.params
         try:
             params = replace(params, size=int(self.var_size.get()))
-        except Exception:
+        except (tk.TclError, ValueError, OverflowError):
             pass
         try:
             params = replace(params, head_ratio=float(self.var_head_ratio.get()))
-        except Exception:
+        except (tk.TclError, ValueError):
             pass
         params = replace(params, remove_background=bool(self.var_remove_bg.get()))
         self.state.params = params
@@ -279,33 +456,49 @@ class PassportShopApp(ttk.Frame):
         if not path:
             return
 
-        try:
-            pil = self._load_image_rgb(path)
-        except Exception as e:
-            messagebox.showerror("Upload failed", f"Could not open image.\n\n{e}")
-            self.set_status("Upload failed.")
-            return
+        # Decoding a large photo can take a while; keep the UI responsive.
+        self._set_processing_ui(True, message="Loading…")
 
-        self.state.input_path = path
-        self.state.original_pil = pil
+        def worker() -> None:
+            err: Exception | None = None
+            pil = None
+            full_size = (0, 0)
+            try:
+                # Only shown on screen; processing re-reads input_path at full size.
+                pil, full_size = load_image_rgb(path, max_side=_ORIGINAL_PREVIEW_MAX_SIDE)
+            except Exception as e:
+                err = e
 
-        # New upload invalidates downstream
-        self.state.processed_pil = None
-        self.state.processed_temp_path = None
-        self.state.validation_report = None
+            def finish_on_ui_thread() -> None:
+                if err is not None:
+                    self._set_processing_ui(False)
+                    messagebox.showerror("Upload failed", f"Could not open image.\n\n{err}")
+                    self.set_status("Upload failed.")
+                    return
 
-        self.original_canvas.set_image(pil)
-        self.original_meta.configure(text=f"File: {os.path.basename(path)}   Size: {pil.width}x{pil.height}")
+                self.state.input_path = path
+                self.state.original_pil = pil
 
-        self.processed_canvas.clear()
-        self.processed_meta.configure(text="Not processed yet.")
-        self._clear_validation_view()
+                # New upload invalidates downstream
+                self.state.processed_pil = None
+                self.state.processed_temp_path = None
+                self.state.validation_report = None
 
-        self.btn_process.state(["!disabled"])
-        self.btn_validate.state(["disabled"])
-        self.btn_save.state(["disabled"])
+                self._schedule_canvas_image(self.original_canvas, pil)
+                self.original_meta.configure(
+                    text=f"File: {os.path.basename(path)}   Size: {full_size[0]}x{full_size[1]}"
+                )
+
+                self._schedule_canvas_image(self.processed_canvas, None)
+                self.processed_meta.configure(text="Not processed yet.")
+                self._clear_validation_view()
+
+                self._set_processing_ui(False)
+                self.set_status("Loaded photo. Ready to process.")
+
+            self._post(finish_on_ui_thread)
 
-        self.set_status("Loaded photo. Ready to process.")
+        self._worker.submit(worker)
 
     # ---------- Step 3: Process (existing pipeline) ----------
 
@@ -314,11 +507,12 @@ class PassportShopApp(ttk.Frame):
             messagebox.showwarning("No input", "Upload a photo first.")
             return
 
-        if process_passport_photo is None:
+        pipeline_future = self._pipeline_future
+        if pipeline_future.done() and pipeline_future.result() is None:
             messagebox.showerror(
                 "Pipeline not found",
-                "Could not import process_passport_photo.\n\n"
-                "Make sure passport_photo.py is importable and contains process_passport_photo().",
+                "Could not import process_passport_photo_to_pil.\n\n"
+                "Make sure passport_photo.py is importable and contains process_passport_photo_to_pil().",
             )
             return
 
@@ -326,19 +520,26 @@ class PassportShopApp(ttk.Frame):
         params = self.state.params
 
         in_path = self.state.input_path
-        out_path = str(self.temp_paths.preview_image)
-        self.state.processed_temp_path = out_path
+        # The preview is shown from memory; the temp JPEG is written afterwards.
+        self.state.processed_temp_path = None
 
         # UI: busy + disable controls
-        self._set_processing_ui(True, message="Processing…")
+        loading = not pipeline_future.done()
+        self._set_processing_ui(True, message="Loading pipeline…" if loading else "Processing…")
 
         def worker() -> None:
             err: Exception | None = None
             tb: str | None = None
+            processed = None
             try:
-                process_passport_photo(
+                # Blocks only while the warm-up import is still running.
+                process_passport_photo_to_pil = pipeline_future.result()
+                if process_passport_photo_to_pil is None:
+                    raise RuntimeError("Could not import process_passport_photo_to_pil from passport_photo.py.")
+                if loading:
+                    self._post(self.set_status, "Processing…")
+                processed = process_passport_photo_to_pil(
                     input_path=in_path,
-                    output_path=out_path,
                     size=params.size,
                     head_ratio=params.head_ratio,
                     remove_background=params.remove_background,
@@ -350,38 +551,64 @@ class PassportShopApp(ttk.Frame):
             def finish_on_ui_thread() -> None:
                 if err is not None:
                     self.state.processed_pil = None
+                    self.state.processed_temp_path = None
                     self.state.validation_report = None
                     self._set_processing_ui(False)
                     messagebox.showerror("Processing failed", f"{err}\n\n{tb or ''}".strip())
                     self.set_status("Processing failed.")
                     return
 
-                try:
-                    processed = self._load_image_rgb(out_path)
-                except Exception as e2:
-                    self.state.processed_pil = None
-                    self.state.validation_report = None
-                    self._set_processing_ui(False)
-                    messagebox.showerror("Load failed", f"Processed image was created, but could not be loaded.\n\n{e2}")
-                    self.set_status("Load processed image failed.")
-                    return
-
-                # Update state + UI
+                # Update state + UI. A preview written for the previous result may have
+                # landed since on_process cleared the path; it doesn't match this image.
                 self.state.processed_pil = processed
+                self.state.processed_temp_path = None
                 self.state.validation_report = None
                 self._clear_validation_view()
 
-                self.processed_canvas.set_image(processed)
-                self.processed_meta.configure(
-                    text=f"Temp: {os.path.basename(out_path)}   Size: {processed.width}x{processed.height}"
-                )
+                self._schedule_canvas_image(self.processed_canvas, processed)
+                self.processed_meta.configure(text=f"Size: {processed.width}x{processed.height}")
 
                 self._set_processing_ui(False)
                 self.set_status("Processing complete. Ready to validate or save.")
 
-            self.master.after(0, finish_on_ui_thread)
+                self._write_preview_async(processed)
+
+            self._post(finish_on_ui_thread)
+
+        self._worker.submit(worker)
+
+    def _write_preview_async(self, processed: Image.Image) -> None:
+        """
+        Encode the processed image to the temp preview JPEG in the background.
 
-        threading.Thread(target=worker, daemon=True).start()
+        The preview is already on screen; the file only lets Save/Export copy the
+        JPEG instead of re-encoding it on the UI thread. processed_temp_path is set
+        once the file is complete, and only if that image is still current. The JPEG
+        is written under a temporary name and renamed into place, so the preview path
+        never holds a partially written file.
+        """
+        out_path = str(self.temp_paths.preview_image)
+        part_path = out_path + ".part"
+
+        def worker() -> None:
+            try:
+                img = processed if processed.mode == "RGB" else processed.convert("RGB")
+                img.save(part_path, format="JPEG", quality=95, optimize=True)
+                os.replace(part_path, out_path)
+            except Exception:
+                try:
+                    os.remove(part_path)
+                except OSError:
+                    pass
+                return  # Save/Export falls back to encoding from memory
+
+            def finish_on_ui_thread() -> None:
+                if self.state.processed_pil is processed:
+                    self.state.processed_temp_path = out_path
+
+            self._post(finish_on_ui_thread)
+
+        self._worker.submit(worker)
 
     # ---------- Step 4: Validate ----------
 
@@ -394,45 +621,41 @@ class PassportShopApp(ttk.Frame):
         processed = self.state.processed_pil
         params = self.state.params
 
-        self._set_processing_ui(True, message="Validating…")
-
-        def worker() -> None:
-            err: Exception | None = None
-            tb: str | None = None
-            report = None
-            try:
-                report = validate_passport_photo(processed, params)
-            except Exception as e:
-                err = e
-                tb = traceback.format_exc()
+        # Each Process creates a new image object, so identity is a safe cache key.
+        cached = self._pixel_metrics
+        pixel_metrics = cached[1] if cached is not None and cached[0] is processed else None
 
-            def finish_on_ui_thread() -> None:
-                self._set_processing_ui(False)
-                if err is not None:
-                    details = f"{err}\n\n{tb or ''}".strip()
-                    messagebox.showerror("Validation failed", details)
-                    self.set_status("Validation failed.")
-                    return
+        self._set_processing_ui(True, message="Validating…")
 
-                self.state.validation_report = report
-                self._render_validation_report()
+        fut = self._worker.submit(_validate_and_format, processed, params, pixel_metrics)
+        fut.add_done_callback(lambda f: self._post(self._apply_report, f, processed))
 
-                if report and report.passed:
-                    self.set_status("Validation complete. All checks passed.")
-                else:
-                    self.set_status("Validation complete (some checks failed).")
+    def _apply_report(self, fut: Future, processed: Image.Image) -> None:
+        self._set_processing_ui(False)
+        try:
+            report, rows, text, pixel_metrics = fut.result()
+        except Exception as e:
+            tb = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            messagebox.showerror("Validation failed", f"{e}\n\n{tb}".strip())
+            self.set_status("Validation failed.")
+            return
 
-            self.master.after(0, finish_on_ui_thread)
+        if pixel_metrics is not None:
+            self._pixel_metrics = (processed, pixel_metrics)
+        self.state.validation_report = report
+        self._render_validation_report(rows, text)
 
-        threading.Thread(target=worker, daemon=True).start()
+        if report.passed:
+            self.set_status("Validation complete. All checks passed.")
+        else:
+            self.set_status("Validation complete (some checks failed).")
 
     def on_copy_report(self) -> None:
-        report = self.state.validation_report
-        if report is None:
+        text = self._report_text
+        if self.state.validation_report is None or text is None:
             messagebox.showinfo("No report", "Run Validate first.")
             return
 
-        text = format_report_text(report)
         self.master.clipboard_clear()
         self.master.clipboard_append(text)
         self.set_status("Copied validation report.")
@@ -468,35 +691,9 @@ class PassportShopApp(ttk.Frame):
             return
 
         out_path = str(Path(path))
-        out_lower = out_path.lower()
 
         try:
-            # If user saves as JPEG and we already have a JPEG temp file, copy it to avoid recompression.
-            temp = self.state.processed_temp_path
-            if (
-                temp
-                and os.path.exists(temp)
-                and out_lower.endswith((".jpg", ".jpeg"))
-                and temp.lower().endswith((".jpg", ".jpeg"))
-                and os.path.abspath(temp) != os.path.abspath(out_path)
-            ):
-                shutil.copyfile(temp, out_path)
-            else:
-                img = self.state.processed_pil
-                if out_lower.endswith((".jpg", ".jpeg")):
-                    if img.mode != "RGB":
-                        img = img.convert("RGB")
-                    img.save(out_path, format="JPEG", quality=95, optimize=True)
-                elif out_lower.endswith(".png"):
-                    img.save(out_path, format="PNG", optimize=True)
-                else:
-                    # Default to JPEG if extension is unknown
-                    if not out_path.lower().endswith((".jpg", ".jpeg", ".png")):
-                        out_path += ".jpg"
-                    img = self.state.processed_pil
-                    if img.mode != "RGB":
-                        img = img.convert("RGB")
-                    img.save(out_path, format="JPEG", quality=95, optimize=True)
+            out_path = self._with_busy("Saving…", lambda: self._write_output_image(out_path))
 
             # Optional: export JSON validation report next to the image
             report = self.state.validation_report
@@ -543,15 +740,47 @@ Saved report:
             )
             self.set_status("Save failed.")
 
+    def _write_output_image(self, out_path: str) -> str:
+        """Write the processed photo to out_path; returns the path actually written."""
+        out_lower = out_path.lower()
+        # If user saves as JPEG and we already have a JPEG temp file, copy it to avoid recompression.
+        temp = self.state.processed_temp_path
+        if (
+            temp
+            and os.path.exists(temp)
+            and out_lower.endswith((".jpg", ".jpeg"))
+            and temp.lower().endswith((".jpg", ".jpeg"))
+            and os.path.abspath(temp) != os.path.abspath(out_path)
+        ):
+            shutil.copyfile(temp, out_path)
+        else:
+            img = self.state.processed_pil
+            if out_lower.endswith((".jpg", ".jpeg")):
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
+                img.save(out_path, format="JPEG", quality=95, optimize=True)
+            elif out_lower.endswith(".png"):
+                img.save(out_path, format="PNG", optimize=True)
+            else:
+                # Default to JPEG if extension is unknown
+                if not out_path.lower().endswith((".jpg", ".jpeg", ".png")):
+                    out_path += ".jpg"
+                img = self.state.processed_pil
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
+                img.save(out_path, format="JPEG", quality=95, optimize=True)
+        return out_path
+
     def on_reset(self) -> None:
         self.state.reset()
+        self._pixel_metrics = None
         try:
             self.temp_paths.cleanup()
         except Exception:
             pass
 
-        self.original_canvas.clear()
-        self.processed_canvas.clear()
+        self._schedule_canvas_image(self.original_canvas, None)
+        self._schedule_canvas_image(self.processed_canvas, None)
         self.original_meta.configure(text="No file loaded.")
         self.processed_meta.configure(text="Not processed yet.")
         self._clear_validation_view()
@@ -580,6 +809,11 @@ def run() -> None:
     root.minsize(900, 600)
 
     state = AppState()
-    PassportShopApp(root, state)
+    app = PassportShopApp(root, state)
+
+    def on_close() -> None:
+        app.shutdown()
+        root.destroy()
 
+    root.protocol("WM_DELETE_WINDOW", on_close)
     root.mainloop()
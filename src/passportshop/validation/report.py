@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleResult:
     """
     Result of a single validation rule.
@@ -13,7 +13,7 @@ class RuleResult:
     message: str
     metrics: dict[str, Any] | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationReport:
     """
     Collection of validation rule results for a processed photo.
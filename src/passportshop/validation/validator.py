@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import numpy as np
 from PIL import Image
@@ -9,13 +12,22 @@ from passportshop.core.models import ProcessingParams
 from passportshop.validation.report import RuleResult, ValidationReport
 
 
+_Point = Tuple[float, float]
+
+
 # Prefer the same landmark detector used by the generation pipeline, if available.
+# passport_photo pulls in cv2/mediapipe, so it is imported on first use rather than
+# here; set this to a callable to override the pipeline detector.
 _detect_face_landmarks = None
-try:
-    from passport_photo import _detect_face_landmarks as _pipeline_detect_face_landmarks  # type: ignore
-    _detect_face_landmarks = _pipeline_detect_face_landmarks
-except Exception:
-    _detect_face_landmarks = None
+
+
+@lru_cache(maxsize=None)
+def _pipeline_detector() -> Optional[Callable[..., Any]]:
+    try:
+        from passport_photo import _detect_face_landmarks as detect  # type: ignore
+    except Exception:
+        return None
+    return detect
 
 
 def _pil_to_np_rgb(img: Image.Image) -> np.ndarray:
@@ -24,67 +36,174 @@ def _pil_to_np_rgb(img: Image.Image) -> np.ndarray:
         arr = np.stack([arr, arr, arr], axis=-1)
     if arr.shape[-1] == 4:
         arr = arr[:, :, :3]
-    return arr.astype(np.uint8)
+    if arr.dtype != np.uint8:
+        arr = arr.astype(np.uint8)
+    # No copy for the usual RGB input, where np.asarray() already gave packed uint8.
+    # The result may be read-only; the rules only read it.
+    return np.ascontiguousarray(arr)
+
+
+# Rec.709 luma weights scaled by 256 (they sum to 256, so white stays 255)
+_LUMA_W = np.array([54, 183, 19], dtype=np.uint16)
+
+# Lighting clip thresholds (luma <= 10, luma >= 245) on the same 256x scale
+_DARK_CLIP_ACC = 10 * 256
+_BRIGHT_CLIP_ACC = 245 * 256
 
 
 def _near_white_ratio_border(img_rgb: np.ndarray, margin: int, thr: int = 245) -> float:
     h, w, _ = img_rgb.shape
     m = max(1, min(margin, h // 2, w // 2))
-    top = img_rgb[:m, :, :]
-    bottom = img_rgb[h - m :, :, :]
-    left = img_rgb[:, :m, :]
-    right = img_rgb[:, w - m :, :]
-
-    border = np.concatenate(
-        [top.reshape(-1, 3), bottom.reshape(-1, 3), left.reshape(-1, 3), right.reshape(-1, 3)],
-        axis=0,
+    # Top/bottom bands span the full width; left/right exclude the corners they share.
+    bands = (
+        img_rgb[:m, :, :],
+        img_rgb[h - m :, :, :],
+        img_rgb[m : h - m, :m, :],
+        img_rgb[m : h - m, w - m :, :],
     )
-    mask = (border[:, 0] >= thr) & (border[:, 1] >= thr) & (border[:, 2] >= thr)
-    return float(mask.mean()) if border.size else 0.0
+    hits = 0
+    total = 0
+    for band in bands:
+        hits += int(np.count_nonzero((band >= thr).all(axis=-1)))
+        total += band.shape[0] * band.shape[1]
+    return hits / total if total else 0.0
 
 
 def _lighting_metrics(img_rgb: np.ndarray) -> dict[str, Any]:
-    gray = (0.2126 * img_rgb[:, :, 0] + 0.7152 * img_rgb[:, :, 1] + 0.0722 * img_rgb[:, :, 2]).astype(np.float32)
-    mean = float(gray.mean())
-    std = float(gray.std())
-    dark_clip = float((gray <= 10).mean())
-    bright_clip = float((gray >= 245).mean())
+    n = img_rgb.shape[0] * img_rgb.shape[1]
+    if not n:
+        return {"luma_mean": 0.0, "luma_std": 0.0, "dark_clip": 0.0, "bright_clip": 0.0}
+
+    # 8.8 fixed-point luma; 255 * 256 + 128 still fits uint16, so this never
+    # materialises a float image.
+    wr, wg, wb = _LUMA_W
+    # Explicit dtype: NumPy 1.x casting would keep uint8 * small uint16 scalar as uint8.
+    gray = np.multiply(img_rgb[:, :, 0], wr, dtype=np.uint16)
+    gray += np.multiply(img_rgb[:, :, 1], wg, dtype=np.uint16)
+    gray += np.multiply(img_rgb[:, :, 2], wb, dtype=np.uint16)
+
+    # Clip fractions are counted on the unrounded sum, so the thresholds stay at
+    # luma <= 10 and >= 245 exactly rather than moving by half a level.
+    dark_clip = np.count_nonzero(gray <= _DARK_CLIP_ACC) / n
+    bright_clip = np.count_nonzero(gray >= _BRIGHT_CLIP_ACC) / n
+
+    # Mean/std come from a 256-bin histogram of the rounded luma.
+    gray += np.uint16(128)
+    gray >>= 8
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256, dtype=np.float64)
+    mean = float(hist @ levels / n)
+    std = float(np.sqrt(max(0.0, hist @ (levels * levels) / n - mean * mean)))
     return {"luma_mean": mean, "luma_std": std, "dark_clip": dark_clip, "bright_clip": bright_clip}
 
 
-def _lm_xy(p: Any) -> Optional[Tuple[float, float]]:
+def _get_landmarks(img_rgb: Union[Image.Image, np.ndarray]) -> Optional[Tuple[_Point, _Point, _Point]]:
     """
-    Accepts either:
-      - LandmarkPx (with .x/.y) from passport_photo.py :contentReference[oaicite:2]{index=2}
-      - (x, y) tuple/list
-    Returns (x, y) as floats.
+    Return (nose_tip, forehead_top, chin) as (x, y) float tuples if possible.
+
+    Accepts the uint8 RGB array the other rules use, so the detector reuses that
+    buffer instead of converting the PIL image again. The detector may return points
+    as objects with .x/.y or as (x, y) pairs (e.g. the (3, 2) array from
+    passport_photo.py); they are normalized here once.
     """
-    if p is None:
+    detect = _detect_face_landmarks if _detect_face_landmarks is not None else _pipeline_detector()
+    if detect is None:
         return None
-    if hasattr(p, "x") and hasattr(p, "y"):
-        return float(p.x), float(p.y)
     try:
-        return float(p[0]), float(p[1])
+        lm = detect(img_rgb)
+        if lm is None:
+            return None
+        nose, forehead, chin = (
+            (float(p.x), float(p.y)) if hasattr(p, "x") else (float(p[0]), float(p[1])) for p in lm
+        )
     except Exception:
         return None
+    return nose, forehead, chin
 
 
-def _get_landmarks(img_rgb_pil: Image.Image) -> Optional[Tuple[Any, Any, Any]]:
-    """Return (nose_tip, forehead_top, chin) if possible."""
-    if _detect_face_landmarks is None:
-        return None
-    try:
-        return _detect_face_landmarks(img_rgb_pil)  # type: ignore[misc]
-    except Exception:
-        return None
+# Pixel statistics are sampled down to about this many pixels on the shorter side
+_STATS_MIN_SIDE = 300
+
 
+@dataclass(frozen=True)
+class PixelMetrics:
+    """
+    Border-whiteness and lighting statistics of one processed image.
 
-def validate_passport_photo(processed_rgb: Image.Image, params: ProcessingParams) -> ValidationReport:
+    They depend only on the pixels, so a caller that validates the same image again
+    (e.g. repeated Validate clicks) can compute them once and pass them back in.
+    """
+    white_ratio: float
+    margin_px: int
+    lighting: dict[str, Any]
+
+
+def _pixel_metrics(img_rgb: np.ndarray) -> PixelMetrics:
+    # Both are statistics over many pixels, so they are taken on a strided view (no
+    # copy) with at least _STATS_MIN_SIDE pixels per side; margin is scaled to match.
+    h, w = img_rgb.shape[0], img_rgb.shape[1]
+    margin = max(10, int(0.05 * min(h, w)))
+    step = max(1, min(h, w) // _STATS_MIN_SIDE)
+    sample = img_rgb[::step, ::step]
+    white_ratio = _near_white_ratio_border(sample, margin=max(1, margin // step), thr=245)
+    return PixelMetrics(white_ratio=white_ratio, margin_px=margin, lighting=_lighting_metrics(sample))
+
+
+def compute_pixel_metrics(processed_rgb: Image.Image) -> PixelMetrics:
+    """Compute the PixelMetrics that validate_passport_photo() would use for processed_rgb."""
+    return _pixel_metrics(_pil_to_np_rgb(processed_rgb))
+
+
+# Status marks used in the report rows and the text report
+_PASS_MARK = "✅"
+_FAIL_MARK = "❌"
+
+
+# Rules after Size, in report order; listed as skipped when fast_fail short-circuits.
+_IMAGE_RULE_IDS = ("Head ratio", "Centering", "Background whiteness", "Lighting")
+
+# Below this side length, or beyond this aspect ratio, the image can't be a passport photo.
+_FAST_FAIL_MIN_SIDE = 200
+_FAST_FAIL_MAX_ASPECT = 1.2
+
+
+def validate_passport_photo(
+    processed_rgb: Image.Image,
+    params: ProcessingParams,
+    *,
+    fast_fail: bool = True,
+    pixel_metrics: Optional[PixelMetrics] = None,
+) -> ValidationReport:
     """
     Validate a processed passport photo and return a ValidationReport.
 
     Rules are best-effort heuristics intended for user guidance. They are NOT an official
     adjudication of passport acceptance.
+
+    With fast_fail, an image that is far too small or far from square only gets the
+    Size check; the remaining rules (landmark detection included) are reported as
+    skipped instead of being run.
+
+    pixel_metrics, if given, must come from compute_pixel_metrics() (or
+    validate_passport_photo_with_metrics()) on this same image; it replaces the
+    border-whiteness and lighting passes.
+    """
+    report, _ = validate_passport_photo_with_metrics(
+        processed_rgb, params, fast_fail=fast_fail, pixel_metrics=pixel_metrics
+    )
+    return report
+
+
+def validate_passport_photo_with_metrics(
+    processed_rgb: Image.Image,
+    params: ProcessingParams,
+    *,
+    fast_fail: bool = True,
+    pixel_metrics: Optional[PixelMetrics] = None,
+) -> Tuple[ValidationReport, Optional[PixelMetrics]]:
+    """
+    Same as validate_passport_photo(), but also return the PixelMetrics it used (None
+    if fast_fail skipped them), so the image is converted to an array only once.
     """
     results: List[RuleResult] = []
 
@@ -100,16 +219,28 @@ def validate_passport_photo(processed_rgb: Image.Image, params: ProcessingParams
         )
     )
 
+    if fast_fail and (
+        min(w, h) < _FAST_FAIL_MIN_SIDE or max(w, h) > _FAST_FAIL_MAX_ASPECT * min(w, h)
+    ):
+        results.extend(
+            RuleResult(
+                rule_id=rule_id,
+                passed=False,
+                message="Size out of range; other checks skipped.",
+                metrics={"skipped": True},
+            )
+            for rule_id in _IMAGE_RULE_IDS
+        )
+        return ValidationReport(passed=False, results=results), None
+
     img_rgb = _pil_to_np_rgb(processed_rgb)
     H, W = img_rgb.shape[0], img_rgb.shape[1]
 
     # Landmarks for head ratio + centering
     nose_xy = forehead_xy = chin_xy = None
-    lm = _get_landmarks(processed_rgb)
+    lm = _get_landmarks(img_rgb)
     if lm is not None:
-        nose_xy = _lm_xy(lm[0])
-        forehead_xy = _lm_xy(lm[1])
-        chin_xy = _lm_xy(lm[2])
+        nose_xy, forehead_xy, chin_xy = lm
 
     # Rule: Head ratio
     if forehead_xy is None or chin_xy is None:
@@ -166,8 +297,11 @@ def validate_passport_photo(processed_rgb: Image.Image, params: ProcessingParams
         )
 
     # Rule: Background whiteness (border pixels)
-    margin = max(10, int(0.05 * min(H, W)))
-    white_ratio = _near_white_ratio_border(img_rgb, margin=margin, thr=245)
+    if pixel_metrics is None:
+        pixel_metrics = _pixel_metrics(img_rgb)
+    margin = pixel_metrics.margin_px
+    white_ratio = pixel_metrics.white_ratio
+    lmets = pixel_metrics.lighting
     bg_ok = white_ratio >= 0.95
     bg_msg = f"Near-white border pixels: {white_ratio*100:.1f}% (target ≥ 95%)."
     if not bg_ok:
@@ -182,7 +316,6 @@ def validate_passport_photo(processed_rgb: Image.Image, params: ProcessingParams
     )
 
     # Rule: Lighting heuristics
-    lmets = _lighting_metrics(img_rgb)
     mean = lmets["luma_mean"]
     std = lmets["luma_std"]
     dark_clip = lmets["dark_clip"]
@@ -202,21 +335,25 @@ def validate_passport_photo(processed_rgb: Image.Image, params: ProcessingParams
             rule_id="Lighting",
             passed=light_ok,
             message=light_msg,
-            metrics=lmets,
+            metrics=dict(lmets),
         )
     )
 
     passed = all(r.passed for r in results)
-    return ValidationReport(passed=passed, results=results)
+    return ValidationReport(passed=passed, results=results), pixel_metrics
+
+
+def format_report_rows(report: ValidationReport) -> list[tuple[str, str, str]]:
+    """(rule, status mark, message) per rule, e.g. for a table view."""
+    return [(r.rule_id, _PASS_MARK if r.passed else _FAIL_MARK, r.message) for r in report.results]
 
 
 def format_report_text(report: ValidationReport) -> str:
-    lines: List[str] = []
-    lines.append("PassportShop Validation Report")
-    lines.append("-" * 32)
-    lines.append(f"Overall: {'PASS' if report.passed else 'FAIL'}")
-    lines.append("")
-    for r in report.results:
-        mark = "✅" if r.passed else "❌"
-        lines.append(f"{mark} {r.rule_id}: {r.message}")
-    return "\n".join(lines)
+    header = (
+        "PassportShop Validation Report",
+        "-" * 32,
+        f"Overall: {'PASS' if report.passed else 'FAIL'}",
+        "",
+    )
+    rules = (f"{_PASS_MARK if r.passed else _FAIL_MARK} {r.rule_id}: {r.message}" for r in report.results)
+    return "\n".join(chain(header, rules))
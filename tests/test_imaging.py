@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from tests._test_path import SRC  # noqa: F401
+
+from passportshop.core.imaging import exif_orientation, load_image_rgb
+
+
+class TestImaging(unittest.TestCase):
+    def test_exif_orientation_skips_images_without_exif(self):
+        img = Image.new("RGB", (8, 8))
+        exif = Image.Exif()
+        exif[0x0112] = 8
+        with tempfile.TemporaryDirectory() as d:
+            png = os.path.join(d, "plain.png")
+            img.save(png)
+            jpg = os.path.join(d, "rot.jpg")
+            img.save(jpg, exif=exif)
+            with Image.open(png) as im, patch.object(type(im), "getexif") as getexif:
+                self.assertEqual(exif_orientation(im), 1)
+                getexif.assert_not_called()
+            with Image.open(jpg) as im:
+                self.assertEqual(exif_orientation(im), 8)
+
+    def test_load_image_rgb_returns_decoded_images(self):
+        img = Image.new("RGB", (64, 40), (10, 200, 30))
+        with tempfile.TemporaryDirectory() as d:
+            for name in ("up.jpg", "up.png", "gray.png"):
+                path = os.path.join(d, name)
+                (img.convert("L") if name.startswith("gray") else img).save(path)
+                loaded, full_size = load_image_rgb(path, max_side=16)
+                # Decoded up front: no lazy decode left for the UI thread, file released
+                self.assertIsNone(getattr(loaded, "fp", None), name)
+                self.assertEqual(loaded.mode, "RGB")
+                self.assertEqual(full_size, (64, 40))
@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 import importlib
 from unittest import skipIf
+from unittest.mock import patch
 
 import numpy as np
 from PIL import Image
@@ -31,12 +34,76 @@ class TestPassportPhotoHelpers(unittest.TestCase):
         self.assertEqual(arr1.shape, arr2.shape)
         self.assertTrue(np.allclose(arr1, arr2, atol=1))
 
+    def test_load_image_bgr_applies_exif_orientation(self):
+        img = Image.new("RGB", (40, 20), (200, 0, 0))  # red, landscape
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotate 90 CW on display
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "rot.jpg")
+            img.save(path, exif=exif)
+            bgr = self.pp._load_image_bgr(path)
+        self.assertEqual(bgr.shape, (40, 20, 3))
+        b, g, r = (int(c) for c in bgr[20, 10])
+        self.assertGreater(r, 150)
+        self.assertLess(b, 60)
+
+    def test_load_image_rgb_only_transposes_when_rotated(self):
+        img = Image.new("RGB", (40, 20), (0, 0, 200))
+        exif = Image.Exif()
+        with tempfile.TemporaryDirectory() as d:
+            plain = os.path.join(d, "plain.jpg")
+            img.save(plain)
+            exif[0x0112] = 6
+            rotated = os.path.join(d, "rot.jpg")
+            img.save(rotated, exif=exif)
+            self.assertEqual(self.pp._load_image_rgb(plain).size, (40, 20))
+            self.assertEqual(self.pp._load_image_rgb(rotated).size, (20, 40))
+
+    def test_exif_orientation_skips_images_without_exif(self):
+        img = Image.new("RGB", (8, 8))
+        exif = Image.Exif()
+        exif[0x0112] = 8
+        with tempfile.TemporaryDirectory() as d:
+            png = os.path.join(d, "plain.png")
+            img.save(png)
+            jpg = os.path.join(d, "rot.jpg")
+            img.save(jpg, exif=exif)
+            with Image.open(png) as im, patch.object(type(im), "getexif") as getexif:
+                self.assertEqual(self.pp._exif_orientation(im), 1)
+                getexif.assert_not_called()
+            with Image.open(jpg) as im:
+                self.assertEqual(self.pp._exif_orientation(im), 8)
+
+    def test_save_bgr_keeps_channel_order(self):
+        bgr = np.zeros((8, 8, 3), dtype=np.uint8)
+        bgr[..., 2] = 255  # red in BGR
+        with tempfile.TemporaryDirectory() as d:
+            for name in ("out.png", "out.jpg"):
+                path = os.path.join(d, name)
+                self.pp._save_bgr(path, bgr)
+                r, g, b = Image.open(path).convert("RGB").getpixel((4, 4))
+                self.assertGreater(r, 240)
+                self.assertLess(b, 15)
+
     def test_resize_bgr_scale(self):
         bgr = np.zeros((10, 20, 3), dtype=np.uint8)
         out = self.pp._resize_bgr(bgr, scale=0.5)
         self.assertEqual(out.shape[0], 5)
         self.assertEqual(out.shape[1], 10)
 
+    def test_crop_and_resize_matches_resize_then_crop(self):
+        # Smooth gradient so sub-pixel alignment differences stay small
+        yy, xx = np.mgrid[0:400, 0:300]
+        bgr = np.stack([xx % 256, yy % 256, (xx + yy) % 256], axis=-1).astype(np.uint8)
+        scale = 0.5
+        center = (150.0, 200.0)
+        expected = self.pp._crop_square_with_padding(
+            self.pp._resize_bgr(bgr, scale), (center[0] * scale, center[1] * scale), size=100
+        )
+        out = self.pp._crop_and_resize_bgr(bgr, center, scale=scale, size=100)
+        self.assertEqual(out.shape, (100, 100, 3))
+        self.assertLess(np.abs(out.astype(int) - expected.astype(int)).mean(), 2.0)
+
     def test_crop_square_with_padding(self):
         # 4x4 image with distinct center pixel
         bgr = np.zeros((4, 4, 3), dtype=np.uint8)
@@ -45,3 +112,61 @@ class TestPassportPhotoHelpers(unittest.TestCase):
         self.assertEqual(out.shape, (4, 4, 3))
         # Top-left should be padding white because crop goes out of bounds
         self.assertTrue((out[0, 0] == np.array([255,255,255])).all())
+
+    def test_white_background_composites_with_mask(self):
+        class FakeSession:
+            def predict(self, img):
+                mask = np.zeros((img.height, img.width), dtype=np.uint8)
+                mask[:, : img.width // 2] = 255  # left half is foreground
+                return [Image.fromarray(mask, "L")]
+
+        bgr = np.full((4, 4, 3), 40, dtype=np.uint8)
+        with patch.object(self.pp, "_get_rembg_session", return_value=FakeSession()):
+            out = self.pp._white_background_with_rembg(bgr)
+        self.assertEqual(out.dtype, np.uint8)
+        self.assertTrue((out[:, :2] == 40).all())
+        self.assertTrue((out[:, 2:] == 255).all())
+
+    def test_white_background_without_rembg_returns_input(self):
+        bgr = np.full((4, 4, 3), 40, dtype=np.uint8)
+        with patch.object(self.pp, "_get_rembg_session", return_value=None):
+            out = self.pp._white_background_with_rembg(bgr)
+        self.assertIs(out, bgr)
+
+    def test_pipeline_without_rembg_never_removes_background(self):
+        with patch.object(self.pp, "_new_face_mesh"):
+            pipeline = self.pp.PassportPipeline(remove_background=False)
+        self.assertIsNone(pipeline.rembg_session)
+        with patch.object(self.pp, "_render_passport_bgr") as render, patch.object(self.pp, "_save_bgr"):
+            pipeline.process("in.jpg", "out.jpg")
+        self.assertFalse(render.call_args.args[3])
+        # Asking for it anyway must not fall back to the shared, unlocked session.
+        with patch.object(self.pp, "_get_rembg_session") as shared:
+            with self.assertRaises(ValueError):
+                pipeline.process("in.jpg", "out.jpg", remove_background=True)
+        shared.assert_not_called()
+
+    def test_batch_jobs_mirrors_subfolders_and_skips_non_images(self):
+        with tempfile.TemporaryDirectory() as d:
+            os.makedirs(os.path.join(d, "in", "sub"))
+            for rel in ("a.jpg", os.path.join("sub", "b.PNG"), "notes.txt"):
+                with open(os.path.join(d, "in", rel), "wb") as f:
+                    f.write(b"x")
+            jobs = self.pp._batch_jobs(os.path.join(d, "in"), os.path.join(d, "out"))
+        outs = sorted(os.path.relpath(str(dst), os.path.join(d, "out")) for _, dst in jobs)
+        self.assertEqual(outs, ["a_passport.jpg", os.path.join("sub", "b_passport.PNG")])
+
+    def test_batch_jobs_skips_earlier_outputs(self):
+        with tempfile.TemporaryDirectory() as d:
+            os.makedirs(os.path.join(d, "in", "out"))
+            for rel in ("a.jpg", "a_passport.jpg", os.path.join("out", "c_passport.jpg")):
+                with open(os.path.join(d, "in", rel), "wb") as f:
+                    f.write(b"x")
+            in_dir = os.path.join(d, "in")
+            # Output folder inside the input folder: its contents are never inputs
+            nested = self.pp._batch_jobs(in_dir, os.path.join(in_dir, "out"))
+            os.remove(os.path.join(in_dir, "out", "c_passport.jpg"))
+            # Same folder: a_passport.jpg is a.jpg's output, not a new input
+            same = self.pp._batch_jobs(in_dir, in_dir)
+        self.assertEqual(sorted(src.name for src, _ in nested), ["a.jpg", "a_passport.jpg"])
+        self.assertEqual([(src.name, dst.name) for src, dst in same], [("a.jpg", "a_passport.jpg")])
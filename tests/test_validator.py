@@ -69,6 +69,61 @@ class TestValidator(unittest.TestCase):
         self.assertTrue(_find(report, "Background whiteness").passed)
         self.assertFalse(_find(report, "Lighting").passed)
 
+    def test_fast_fail_skips_image_rules_for_unusable_size(self):
+        img = Image.fromarray(np.full((100, 100, 3), 255, dtype=np.uint8), "RGB")
+        params = ProcessingParams()
+
+        def fail_landmarks(_img):
+            raise AssertionError("landmarks should not be detected")
+
+        with patch.object(v, "_detect_face_landmarks", new=fail_landmarks):
+            report = v.validate_passport_photo(img, params)
+
+        self.assertEqual(len(report.results), 5)
+        self.assertFalse(report.passed)
+        self.assertFalse(_find(report, "Size").passed)
+        for rule_id in ("Head ratio", "Centering", "Background whiteness", "Lighting"):
+            self.assertIn("skipped", _find(report, rule_id).message)
+
+        with patch.object(v, "_detect_face_landmarks", new=lambda _img: None):
+            report = v.validate_passport_photo(img, params, fast_fail=False)
+        self.assertTrue(_find(report, "Background whiteness").passed)
+
+    def test_precomputed_pixel_metrics_skip_the_pixel_passes(self):
+        img = Image.fromarray(np.full((600, 600, 3), 160, dtype=np.uint8), "RGB")
+        params = ProcessingParams()
+        metrics = v.compute_pixel_metrics(img)
+
+        with patch.object(v, "_detect_face_landmarks", new=lambda _img: None), patch.object(
+            v, "_lighting_metrics", wraps=v._lighting_metrics
+        ) as lighting:
+            first = v.validate_passport_photo(img, params)
+            second = v.validate_passport_photo(img, params, pixel_metrics=metrics)
+            self.assertEqual(lighting.call_count, 1)
+
+            # Nothing is cached on the image itself: changed pixels give fresh results
+            img.paste((0, 0, 0), (0, 0, 600, 600))
+            dark = v.validate_passport_photo(img, params)
+
+        self.assertEqual(_find(first, "Lighting").metrics, _find(second, "Lighting").metrics)
+        self.assertAlmostEqual(_find(first, "Lighting").metrics["luma_mean"], 160.0)
+        self.assertAlmostEqual(_find(dark, "Lighting").metrics["luma_mean"], 0.0)
+
+    def test_validate_with_metrics_converts_the_image_once(self):
+        img = Image.fromarray(np.full((600, 600, 3), 160, dtype=np.uint8), "RGB")
+        params = ProcessingParams()
+
+        with patch.object(v, "_detect_face_landmarks", new=lambda _img: None), patch.object(
+            v, "_pil_to_np_rgb", wraps=v._pil_to_np_rgb
+        ) as to_np:
+            report, metrics = v.validate_passport_photo_with_metrics(img, params)
+            self.assertEqual(to_np.call_count, 1)
+            _, skipped = v.validate_passport_photo_with_metrics(img.resize((100, 100)), params)
+
+        self.assertEqual(metrics, v.compute_pixel_metrics(img))
+        self.assertEqual(_find(report, "Lighting").metrics, metrics.lighting)
+        self.assertIsNone(skipped)  # fast_fail never computed them
+
     def test_format_report_text(self):
         arr = np.full((600, 600, 3), 160, dtype=np.uint8)
         img = Image.fromarray(arr, "RGB")
@@ -81,3 +136,25 @@ class TestValidator(unittest.TestCase):
         self.assertIn("PassportShop Validation Report", txt)
         self.assertIn("Overall:", txt)
         self.assertIn("Size:", txt)
+
+        rows = v.format_report_rows(report)
+        self.assertEqual([r[0] for r in rows], [r.rule_id for r in report.results])
+        for (_, mark, message), r in zip(rows, report.results):
+            self.assertIn(f"{mark} {r.rule_id}: {message}", txt)
+
+    def test_near_white_ratio_border_counts_each_border_pixel_once(self):
+        arr = np.zeros((10, 10, 3), dtype=np.uint8)
+        arr[:2, :, :] = 255  # top band white, rest black
+        # m=2: top 20 + bottom 20 + sides 2*(6*2) = 64 border pixels, 20 of them white
+        self.assertAlmostEqual(v._near_white_ratio_border(arr, margin=2), 20 / 64)
+
+    def test_lighting_clip_fractions_match_float_reference(self):
+        rng = np.random.default_rng(0)
+        arr = rng.integers(0, 21, size=(200, 200, 3), dtype=np.uint8)  # around luma 10
+        arr[100:] += 235  # around luma 245
+        gray = 0.2126 * arr[:, :, 0] + 0.7152 * arr[:, :, 1] + 0.0722 * arr[:, :, 2]
+
+        metrics = v._lighting_metrics(arr)
+        self.assertAlmostEqual(metrics["dark_clip"], float((gray <= 10).mean()), delta=0.002)
+        self.assertAlmostEqual(metrics["bright_clip"], float((gray >= 245).mean()), delta=0.002)
+        self.assertAlmostEqual(metrics["luma_mean"], float(gray.mean()), delta=0.5)